@@ -20,22 +20,27 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=[
         "phonenumbers",
-        "pandas",
+        "orjson",
+        "pandas>=2.2",
+        "pyarrow",
+        "python-calamine",
         "redis",
-        "fuzzywuzzy",
+        "rapidfuzz",
         "requests",
         "beautifulsoup4",
+        "lxml",
         "urllib3",
         "onepasswordconnectsdk",
         "sqlalchemy",
     ],
+    extras_require={
+        "fast": ["connectorx", "hyperscan"],
+    },
 )
@@ -0,0 +1,112 @@
+import asyncio
+import socketserver
+import threading
+
+from utilisys import find_closest_match, find_closest_matches, write_many_to_redis, write_to_redis
+from utilisys import utilisys as utilisys_module
+
+POSITIONS = ["Software Engineer", "Senior Software Engineer"]
+
+
+def test_find_closest_match_prefers_exact_title():
+    assert find_closest_match("Senior Software Engineer", POSITIONS) == "Senior Software Engineer"
+    assert find_closest_match("software engineer", POSITIONS) == "Software Engineer"
+
+
+def test_find_closest_match_breaks_ties_by_ratio():
+    # Both titles are word subsets of the query, so token_set_ratio ties at 100
+    assert find_closest_match("Senior Software Engineer II", POSITIONS) == "Senior Software Engineer"
+
+
+def test_find_closest_match_accepts_any_iterable():
+    assert find_closest_match("Software Engineer, Senior", set(POSITIONS)) == "Senior Software Engineer"
+
+
+def test_find_closest_matches_prefers_exact_title():
+    assert find_closest_matches(
+        ["Senior Software Engineer", "Senior Software Engineer II"], POSITIONS
+    ) == ["Senior Software Engineer", "Senior Software Engineer"]
+
+
+def test_find_closest_match_prefilter_keeps_result():
+    filler = [f"Analyst {i}" for i in range(600)]
+    query = "Principal Software Engineer"
+    assert find_closest_match(query, POSITIONS + filler) == find_closest_match(query, POSITIONS)
+
+
+def test_find_closest_matches_accepts_arrays():
+    import numpy as np
+    import pandas as pd
+
+    queries = ["Senior Software Engineer"]
+    expected = ["Senior Software Engineer"]
+    assert find_closest_matches(queries, np.array(POSITIONS)) == expected
+    assert find_closest_matches(queries, pd.Series(POSITIONS, index=[3, 7])) == expected
+    assert find_closest_matches(queries, np.array([], dtype=str)) == [None]
+
+
+FUZZY_POSITIONS = [
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Project Manager",
+    "Program Analyst",
+    "Systems Administrator",
+]
+
+
+def test_find_closest_match_handles_partial_scores():
+    for query, expected in [
+        ("Project Mgr", "Project Manager"),
+        ("Systems Admin", "Systems Administrator"),
+        ("Sr Software Developer", "Senior Software Engineer"),
+    ]:
+        assert find_closest_match(query, FUZZY_POSITIONS) == expected
+        assert find_closest_matches([query], FUZZY_POSITIONS) == [expected]
+
+
+def test_find_closest_match_keeps_symbols_in_titles():
+    positions = ["C Developer", "C++ Developer", "C# Developer"]
+    assert find_closest_match("C++ Developer", positions) == "C++ Developer"
+    assert find_closest_match("c# developer", positions) == "C# Developer"
+    assert find_closest_matches(["C++ Developer"], positions) == ["C++ Developer"]
+
+
+class _FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Answer just enough RESP2 for SET, pipelines and the client handshake."""
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = []
+            for _ in range(int(line[1:])):
+                size = int(self.rfile.readline()[1:])
+                args.append(self.rfile.read(size + 2)[:-2])
+            command = args[0].upper()
+            if command == b"SET":
+                self.server.store[args[1]] = args[2]
+                self.wfile.write(b"+OK\r\n")
+            elif command == b"HELLO":
+                self.wfile.write(b"*2\r\n$5\r\nproto\r\n:2\r\n")
+            else:
+                self.wfile.write(b"+OK\r\n")
+
+
+def test_write_to_redis_across_event_loops(monkeypatch):
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _FakeRedisHandler)
+    server.daemon_threads = True
+    server.store = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(utilisys_module, "REDIS_HOST", "127.0.0.1")
+    monkeypatch.setattr(utilisys_module, "REDIS_PORT", server.server_address[1])
+    try:
+        for i in range(3):
+            asyncio.run(write_to_redis(f"key{i}", str(i)))
+            asyncio.run(write_many_to_redis({f"many{i}": str(i)}))
+        assert len(server.store) == 6
+        # Each asyncio.run() disconnects and forgets its loop's pool
+        assert utilisys_module._REDIS_POOLS == {}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -27,7 +27,7 @@ import json
 import phonenumbers
 import pandas as pd
 import redis.asyncio as redis
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 import requests
 from bs4 import BeautifulSoup
 import urllib3
@@ -39,3 +39,11 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Import all functions from utilisys.py
 from .utilisys import *
+
+
+def __getattr__(name):
+    # Lazily forward DBCONNECT, which the star import cannot pick up
+    if name == "DBCONNECT":
+        from . import utilisys as _utilisys
+        return _utilisys.DBCONNECT
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
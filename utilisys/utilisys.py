@@ -3,32 +3,142 @@ Provides utility functions for processing text, files, and data.
 """
 from email import policy
 from email.parser import BytesParser
-from typing import Optional, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict, Iterable, List, Union
 from locksys import Locksys
 from intelisys import Intelisys
 import phonenumbers
+import asyncio
+import functools
 import logging
 import re
 import os
+import tempfile
+import io
 import json
+import orjson
 import pandas as pd
 import redis.asyncio as redis
-from fuzzywuzzy import fuzz
+from redis import Redis as SyncRedis, RedisError
+from redis.backoff import NoBackoff
+from redis.retry import Retry as RedisRetry
+from rapidfuzz import fuzz, process
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import urllib3
+from sqlalchemy import create_engine, make_url, text
+
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    from lxml import etree
+    _HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - lxml is a declared dependency
+    etree = None
+    _HTML_PARSER = "html.parser"
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 import logging
 import ast
 
-# Prepare Locksys
-DBCONNECT = Locksys().item("lifsysdb").key("lifsysdb").results()
+@functools.lru_cache(maxsize=128)
+def get_secret(item: str, key: str) -> str:
+    """
+    Fetch a secret through Locksys, once per process.
+
+    Secrets are looked up on first use rather than at import time, and
+    repeated lookups of the same item and key are served from memory. Call
+    get_secret.cache_clear() after rotating a secret.
+
+    Args:
+        item (str): The Locksys item holding the secret.
+        key (str): The key within the item.
+
+    Returns:
+        str: The secret value.
+    """
+    return Locksys().item(item).key(key).results()
+
+
+def __getattr__(name):
+    # DBCONNECT used to be resolved at import time; keep it available lazily
+    if name == "DBCONNECT":
+        return get_secret("lifsysdb", "lifsysdb")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Redis server used for caching and key/value writes
+REDIS_HOST = os.environ.get("REDIS_HOST", "192.168.1.12")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", "6379"))
+
+# Async connection pools, one per event loop since pooled connections are
+# bound to the loop that opened them; each is disconnected and removed when
+# its loop shuts down its async generators, as asyncio.run() does on exit
+_REDIS_POOLS = {}
+
+# Redis cache entry for the contract_requirements table; only used when the
+# Redis server is configured explicitly through REDIS_HOST
+CONTRACT_CACHE_REDIS = "REDIS_HOST" in os.environ
+CONTRACT_CACHE_KEY = "utilisys:contract_requirements"
+CONTRACT_CACHE_TTL = 3600
+CONTRACT_QUERY = "SELECT * FROM contract_requirements"
+
+# Headers that mimic a real browser for HTML fetches
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.3 Safari/605.1.15",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+# Shared HTTP session so repeated fetches reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update(_DEFAULT_HEADERS)
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(
+        _scheme,
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        ),
+    )
+
+# BytesParser keeps no per-message state, so one instance serves every file
+_EMAIL_PARSER = BytesParser(policy=policy.default)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Position lists longer than this are narrowed by shared words before scoring
+POSITION_PREFILTER_THRESHOLD = 500
+
+# Precompiled regular expressions
+_PUNCT = re.compile(r"[^\w\s+#]")
+_NAME_RE = re.compile(r"Name:\s*(.+)")
+_BACKSLASH_ESC_RE = re.compile(r"\\(.*?)\\")
+_JSON_START_RE = re.compile(r"[\{\[]")
+_JSON_ERROR_POS_RE = re.compile(r"line (\d+) column (\d+)")
+_NUM_PREFIX_RE = re.compile(r"^(\d+)\.\s+(.+)$")
+
 
 def standardize_phone_number(phone: str, default_country: str = "US") -> str:
     """
@@ -63,9 +173,49 @@ def standardize_phone_number(phone: str, default_country: str = "US") -> str:
         return phone
 
 
+@functools.lru_cache(maxsize=4096)
+def _standardize_phone_number_cached(phone: str, default_country: str) -> str:
+    """Memoized standardize_phone_number for repeated numbers in a batch."""
+    return standardize_phone_number(phone, default_country)
+
+
+def standardize_phone_numbers(
+    phones: Iterable[str], default_country: str = "US"
+) -> Union[List[str], pd.Series]:
+    """
+    Standardize many phone numbers in one pass.
+
+    Repeated numbers are parsed only once, which is the common case for
+    contact lists and DataFrame columns. A pandas Series comes back as a
+    Series with the same index, so it can be assigned straight back to a
+    column; missing values are left untouched.
+
+    Args:
+        phones (Iterable[str]): The phone numbers to be standardized.
+        default_country (str, optional): The default country code to use for parsing.
+                                         Defaults to "US".
+
+    Returns:
+        list or pd.Series: The standardized phone numbers, in input order.
+
+    Example:
+        >>> df["phone"] = standardize_phone_numbers(df["phone"])
+    """
+    if isinstance(phones, pd.Series):
+        return phones.map(
+            lambda phone: _standardize_phone_number_cached(phone, default_country),
+            na_action="ignore",
+        )
+    return [_standardize_phone_number_cached(phone, default_country) for phone in phones]
+
+
 def flatten_dict(d, parent_key="", sep="_"):
     """
-    Recursively flattens a nested dictionary into a single-level dictionary.
+    Flattens a nested dictionary into a single-level dictionary.
+
+    Nested dictionaries are walked with an explicit stack, so keys come out in
+    the same order as a depth-first recursive walk without building an
+    intermediate dictionary per level.
 
     Args:
         d (dict): The dictionary to be flattened.
@@ -75,16 +225,125 @@ def flatten_dict(d, parent_key="", sep="_"):
     Returns:
         dict: The flattened dictionary.
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
-        elif isinstance(v, list):
-            items.append((new_key, ", ".join(map(str, v))))
+    flat = {}
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            # Exact type checks first; isinstance only runs for other types
+            t = type(v)
+            if t is dict or (t is not list and isinstance(v, dict)):
+                # Descend now; this level resumes from the same iterator afterwards
+                stack.append((new_key, iter(v.items())))
+                break
+            elif t is list or isinstance(v, list):
+                flat[new_key] = ", ".join(map(str, v))
+            else:
+                flat[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return flat
+
+@functools.lru_cache(maxsize=1)
+def _sync_redis():
+    """Return the shared blocking Redis client, which fails fast without retries."""
+    return SyncRedis(
+        REDIS_HOST,
+        REDIS_PORT,
+        socket_connect_timeout=2,
+        retry=RedisRetry(NoBackoff(), 0),
+    )
+
+def _read_cached_contract_requirements():
+    """Return the contract_requirements DataFrame from Redis, or None on a miss."""
+    if not CONTRACT_CACHE_REDIS:
+        return None
+    try:
+        payload = _sync_redis().get(CONTRACT_CACHE_KEY)
+        if payload is None:
+            return None
+        return pd.read_parquet(io.BytesIO(payload))
+    except (RedisError, ImportError, ValueError) as e:
+        logger.warning(f"Could not read contract requirements from Redis: {e}")
+        return None
+
+def _write_cached_contract_requirements(contract_df):
+    """Store the contract_requirements DataFrame in Redis as parquet."""
+    if not CONTRACT_CACHE_REDIS:
+        return
+    try:
+        buf = io.BytesIO()
+        contract_df.to_parquet(buf)
+        _sync_redis().set(
+            CONTRACT_CACHE_KEY, buf.getvalue(), ex=CONTRACT_CACHE_TTL
+        )
+    except (RedisError, ImportError, ValueError) as e:
+        logger.warning(f"Could not write contract requirements to Redis: {e}")
+
+def _read_contract_requirements_from_db(chunksize=10_000):
+    """
+    Read the contract_requirements table from the database.
+
+    Uses connectorx when it is installed, which builds the DataFrame natively.
+    Otherwise, or if connectorx cannot handle the connection, the rows are
+    streamed through a server-side cursor in chunks.
+    """
+    db_connect = get_secret("lifsysdb", "lifsysdb")
+    if cx is not None:
+        # connectorx does not understand SQLAlchemy's "dialect+driver" schemes
+        url = make_url(db_connect)
+        cx_connect = url.set(drivername=url.get_backend_name()).render_as_string(
+            hide_password=False
+        )
+        try:
+            return cx.read_sql(cx_connect, CONTRACT_QUERY, return_type="pandas")
+        except Exception as e:
+            logger.warning(f"connectorx read failed, falling back to SQLAlchemy: {e}")
+
+    engine = create_engine(db_connect)
+    try:
+        with engine.connect().execution_options(stream_results=True) as conn:
+            chunks = list(pd.read_sql(text(CONTRACT_QUERY), conn, chunksize=chunksize))
+    finally:
+        engine.dispose()
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+@functools.lru_cache(maxsize=1)
+def load_contract_requirements():
+    """
+    Load the contract_requirements table as a DataFrame.
+
+    The result is kept in-process for the life of the interpreter. When
+    REDIS_HOST is set, it is also shared across processes through Redis for
+    CONTRACT_CACHE_TTL seconds, so the database is only read on a cold cache. Use clear_contract_requirements_cache()
+    to force a refresh.
+
+    Returns:
+        pd.DataFrame: The contract requirements, one row per labor category.
+    """
+    contract_df = _read_cached_contract_requirements()
+    if contract_df is None:
+        contract_df = _read_contract_requirements_from_db()
+        _write_cached_contract_requirements(contract_df)
+    return contract_df
+
+@functools.lru_cache(maxsize=1)
+def _contract_index():
+    """Map each lcat to its requirements row as a plain dict, keeping the first row per lcat."""
+    contract_df = load_contract_requirements()
+    return contract_df.drop_duplicates("lcat").set_index("lcat").to_dict(orient="index")
+
+def clear_contract_requirements_cache():
+    """Drop the in-process and Redis copies of the contract requirements."""
+    load_contract_requirements.cache_clear()
+    _contract_index.cache_clear()
+    if not CONTRACT_CACHE_REDIS:
+        return
+    try:
+        _sync_redis().delete(CONTRACT_CACHE_KEY)
+    except RedisError as e:
+        logger.warning(f"Could not clear contract requirements in Redis: {e}")
 
 def get_requirements(matched_position):
     """
@@ -97,13 +356,12 @@ def get_requirements(matched_position):
         dict or str: A dictionary containing the position and its formatted requirements,
                      or an error message if the position is not found.
     """
-    from dbsys import DatabaseManager
-    contract_df = DatabaseManager(DBCONNECT).table("contract_requirements").read()
+    contract_index = _contract_index()
     matched_position = matched_position.strip()
-    if matched_position not in contract_df['lcat'].values:
+    requirements = contract_index.get(matched_position)
+    if requirements is None:
         return f"No requirements found for {matched_position}"
 
-    requirements = contract_df.loc[contract_df['lcat'] == matched_position].iloc[0]
     formatted_requirements = {}
 
     for field in [
@@ -113,59 +371,256 @@ def get_requirements(matched_position):
         "experience",
         "skills",
     ]:
-        if field in requirements and not pd.isna(requirements[field]):
-            formatted_requirements[field] = requirements[field]
+        value = requirements.get(field)
+        if value is not None and not pd.isna(value):
+            formatted_requirements[field] = value
         else:
             formatted_requirements[field] = "Not specified"
 
     return {"position": matched_position, "requirements": formatted_requirements}
 
-def find_closest_match(position_applied, positions_list):
+def _normalize_position(position):
+    """Lowercase a position title, replace punctuation other than + and # and collapse whitespace."""
+    return " ".join(_PUNCT.sub(" ", position).lower().split())
+
+@functools.lru_cache(maxsize=32)
+def _normalized_positions(positions):
+    """Normalize a tuple of position titles once and reuse it across calls."""
+    return [_normalize_position(p) for p in positions]
+
+@functools.lru_cache(maxsize=32)
+def _position_lookup(positions):
+    """Map each casefolded and each normalized title to the index of its first occurrence."""
+    raw, normalized = {}, {}
+    for i, position in enumerate(positions):
+        raw.setdefault(position.strip().casefold(), i)
+    for i, position in enumerate(_normalized_positions(positions)):
+        normalized.setdefault(position, i)
+    return raw, normalized
+
+def _exact_position(position_applied, positions):
+    """Return the index of an exact title match, trying the casefolded title first."""
+    raw, normalized = _position_lookup(positions)
+    exact = raw.get(position_applied.strip().casefold())
+    if exact is None:
+        exact = normalized.get(_normalize_position(position_applied))
+    return exact
+
+def _break_tie(query, tied, choices):
+    """Pick the tied index closest by token_sort_ratio, then fuzz.ratio, then list order."""
+    return max(
+        tied,
+        key=lambda i: (
+            fuzz.token_sort_ratio(query, choices[i]),
+            fuzz.ratio(query, choices[i]),
+            -i,
+        ),
+    )
+
+@functools.lru_cache(maxsize=32)
+def _position_token_index(positions):
+    """Map each normalized word to the indices of the positions containing it."""
+    token_index = {}
+    for i, position in enumerate(_normalized_positions(positions)):
+        for token in position.split():
+            token_index.setdefault(token, set()).add(i)
+    return token_index
+
+def find_closest_match(position_applied, positions_list, scorer=fuzz.token_set_ratio):
     """
-    Find the closest match to position_applied in positions_list
-    using Levenshtein distance.
+    Find the closest match to position_applied in positions_list.
+
+    Titles are lowercased and stripped of punctuation other than + and #
+    before scoring. The default token_set_ratio scorer ignores word order and
+    duplicated words, so "Software Engineer, Senior" matches "Senior Software
+    Engineer"; it costs about the same as a plain ratio under RapidFuzz, but
+    scores a title that is a word subset of another as a perfect match. An
+    exact match therefore always wins, first on the casefolded title and then
+    on the normalized one, and positions tied on the top score are ranked by
+    token_sort_ratio, then fuzz.ratio, then list order. The scorer argument
+    only replaces the primary score; normalization, exact matching and tie
+    breaking apply whichever scorer is used.
+
+    Lists longer than POSITION_PREFILTER_THRESHOLD are first narrowed to the
+    positions sharing at least one word with the query, through a word index
+    cached per list; if no position shares a word, the whole list is scored.
+
+    Args:
+        position_applied (str): The position to look up.
+        positions_list (list): The candidate positions.
+        scorer (callable, optional): A RapidFuzz scorer. Defaults to fuzz.token_set_ratio.
+
+    Returns:
+        str or None: The closest position from positions_list, or None if nothing matched.
     """
-    best_match = None
-    highest_ratio = 0
+    positions = tuple(positions_list)
+    choices = _normalized_positions(positions)
+    query = _normalize_position(position_applied)
+
+    exact = _exact_position(position_applied, positions)
+    if exact is not None:
+        return positions[exact]
+
+    all_choices = choices
+    if len(choices) > POSITION_PREFILTER_THRESHOLD:
+        # Only score positions sharing at least one word with the query
+        token_index = _position_token_index(positions)
+        candidates = set()
+        for token in query.split():
+            candidates |= token_index.get(token, set())
+        if candidates:
+            # Keep list order so ties resolve the same as without the prefilter
+            choices = {i: choices[i] for i in sorted(candidates)}
+
+    # Score every candidate once and take the ties from the same scores
+    matches = process.extract(query, choices, scorer=scorer, limit=None)
+    if not matches:
+        return None
+    top = max(match[1] for match in matches)
+    if top == 0:
+        return None
+    tied = [match[2] for match in matches if match[1] == top]
+    return positions[_break_tie(query, tied, all_choices)]
 
-    for position in positions_list:
-        ratio = fuzz.ratio(position_applied.lower(), position.lower())
-        if ratio > highest_ratio:
-            highest_ratio = ratio
-            best_match = position
+def position_similarity_matrix(queries, positions_list, scorer=fuzz.token_set_ratio):
+    """
+    Score every query against every position in a single native call.
 
-    return best_match
+    Args:
+        queries (list): The positions to look up.
+        positions_list (list): The candidate positions.
+        scorer (callable, optional): A RapidFuzz scorer. Defaults to fuzz.token_set_ratio.
 
-def create_work_experience_dict(detailexp):
-    work_dict = {}
+    Returns:
+        numpy.ndarray: A ``len(queries) x len(positions_list)`` matrix of
+                       similarity scores (0-100).
+    """
+    return process.cdist(
+        [_normalize_position(q) for q in queries],
+        _normalized_positions(tuple(positions_list)),
+        scorer=scorer,
+        workers=-1,
+    )
+
+def find_closest_matches(queries, positions_list, scorer=fuzz.token_set_ratio):
+    """
+    Batch version of find_closest_match for many queries against the same list.
+
+    Exact matches and ties on the top score are resolved the same way as in
+    find_closest_match.
+
+    Args:
+        queries (list): The positions to look up.
+        positions_list (list): The candidate positions.
+        scorer (callable, optional): A RapidFuzz scorer. Defaults to fuzz.token_set_ratio.
+
+    Returns:
+        list: The closest match for each query, or None where nothing matched.
+    """
+    positions = tuple(positions_list)
+    if len(positions) == 0:
+        return [None] * len(queries)
+    choices = _normalized_positions(positions)
+    scores = position_similarity_matrix(queries, positions, scorer=scorer)
+
+    matches = []
+    for query, row in zip(queries, scores):
+        exact = _exact_position(query, positions)
+        query = _normalize_position(query)
+        top = row.max()
+        if exact is not None:
+            matches.append(positions[exact])
+        elif top > 0:
+            tied = (row == top).nonzero()[0].tolist()
+            matches.append(positions[_break_tie(query, tied, choices)])
+        else:
+            matches.append(None)
+    return matches
 
-    for work in detailexp["work"]:
-        company = work["company"]
-        work_dict[company] = {
+def create_work_experience_dict(detailexp):
+    # Keyed by company; if a company appears more than once, the last entry wins
+    return {
+        work["company"]: {
             "duration_months": work["dates_of_employment"]["duration_months"],
             "experience": work["experience"],
             "accomplishments": work["accomplishments"],
         }
+        for work in detailexp["work"]
+    }
 
-    return work_dict
+def _first_plain_part(part):
+    """Return the first inline text/plain part, without looking inside attached messages."""
+    if part.get_content_maintype() == "message" and part.is_multipart():
+        return None
+    if part.is_multipart():
+        for subpart in part.iter_parts():
+            found = _first_plain_part(subpart)
+            if found is not None:
+                return found
+        return None
+    if (
+        part.get_content_type() == "text/plain"
+        and part.get_content_disposition() != "attachment"
+    ):
+        return part
+    return None
 
-def parse_eml_file(file_path):
-    """Parse an .eml file and return the body in text"""
+def parse_eml_file(file_path, only_plain=False):
+    """
+    Parse an .eml file and return the body in text.
+
+    Args:
+        file_path (str): The path to the .eml file.
+        only_plain (bool, optional): Return the first inline text/plain part of
+            the message as soon as it is found, without resolving the preferred
+            body across all alternatives. Attached messages are not searched.
+            Defaults to False.
+
+    Returns:
+        str: The plain text body, or the HTML body if there is no plain text part.
+    """
     with open(file_path, "rb") as file:
         # Parse the .eml file content
-        msg = BytesParser(policy=policy.default).parse(file)
+        msg = _EMAIL_PARSER.parse(file)
+
+    if only_plain:
+        part = _first_plain_part(msg)
+        if part is not None:
+            return part.get_content()
 
     # Get the email text
     email_text = msg.get_body(preferencelist=("plain", "html")).get_content()
     return email_text
 
-def read_all_eml_files(directory_path):
-    """Iterate through all .eml files in the specified directory"""
-    for filename in os.listdir(directory_path):
-        if filename.endswith(".eml"):
-            file_path = os.path.join(directory_path, filename)
-            output_text = parse_eml_file(file_path)
-            print(f"Contents of {filename}:\n{output_text}\n")
+def read_all_eml_files(directory_path, max_workers=None):
+    """
+    Parse all .eml files in the specified directory in parallel.
+
+    Files are read and parsed on a thread pool so disk reads overlap with
+    parsing; results are yielded in directory order as they become available.
+
+    Args:
+        directory_path (str): The directory containing the .eml files.
+        max_workers (int, optional): Number of worker threads. Defaults to os.cpu_count().
+
+    Yields:
+        tuple: (filename, email_text) for each .eml file.
+    """
+    # scandir entries carry the file type, so no extra stat call per file
+    with os.scandir(directory_path) as entries:
+        eml_entries = [
+            entry for entry in entries
+            if entry.name.endswith(".eml") and entry.is_file()
+        ]
+    file_paths = [entry.path for entry in eml_entries]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        for entry, output_text in zip(eml_entries, executor.map(parse_eml_file, file_paths)):
+            yield entry.name, output_text
+
+@functools.lru_cache(maxsize=64)
+def _compile_link_pattern(pattern):
+    """Compile the regex that finds the link following pattern."""
+    return re.compile(fr"{pattern}\s*(http://\S+)")
 
 def extract_link(content, pattern):
     """
@@ -177,47 +632,31 @@ def extract_link(content, pattern):
     Returns:
         str or None: The link to the TEXT version if found, None otherwise.
     """
-    # Regular expression to find the TEXT version link
-    text_link_pattern = fr"{pattern}\s*(http://\S+)"
-    match = re.search(text_link_pattern, content)
+    match = _compile_link_pattern(pattern).search(content)
 
     if match:
         return match.group(1)
     else:
         return None
 
-def fetch_and_parse_html(url):
+def fetch_and_parse_html(url, session=None):
     """
     Fetch HTML content from a given URL and parse it using BeautifulSoup.
 
+    Pages are parsed with lxml; the pure-Python html.parser backend is only
+    used if lxml is not installed.
+
     Args:
     url (str): The URL to fetch the HTML content from.
+    session (requests.Session, optional): Session to send the request with.
+        Defaults to a shared module-level session with browser-like headers,
+        pooled connections and retries.
 
     Returns:
     BeautifulSoup: Parsed HTML content, or None if the request failed.
     """
-    # Set up logging
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-    logger = logging.getLogger(__name__)
-
-    # Create a session
-    session = requests.Session()
-
-    # Set up headers to mimic a real browser more closely
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.3 Safari/605.1.15",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-        "Cache-Control": "max-age=0",
-    }
-    session.headers.update(headers)
+    if session is None:
+        session = _SESSION
 
     try:
         # Send a GET request to the URL, with SSL verification
@@ -233,7 +672,7 @@ def fetch_and_parse_html(url):
         response.raise_for_status()
 
         # Parse the HTML content using BeautifulSoup
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(response.content, _HTML_PARSER)
         return soup
 
     except requests.exceptions.SSLError:
@@ -242,7 +681,7 @@ def fetch_and_parse_html(url):
             # If SSL verification fails, try without verification (use cautiously)
             response = session.get(url, verify=False)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(response.content, _HTML_PARSER)
             return soup
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed even without SSL verification: {e}")
@@ -251,6 +690,40 @@ def fetch_and_parse_html(url):
 
     return None
 
+def iter_links(url):
+    """
+    Stream the href of every <a> element on a page without building a DOM.
+
+    Elements are parsed incrementally with lxml and discarded as soon as they
+    have been read, which keeps memory flat and yields the first link before
+    the whole page has been downloaded.
+
+    Args:
+    url (str): The URL to fetch the HTML content from.
+
+    Yields:
+    str: The href attribute of each link, in document order.
+
+    Raises:
+    ImportError: If lxml is not installed.
+    requests.exceptions.RequestException: If the request fails.
+    """
+    if etree is None:
+        raise ImportError("iter_links requires lxml")
+
+    with _SESSION.get(url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        for _, element in etree.iterparse(response.raw, events=("end",), html=True):
+            if element.tag == "a":
+                href = element.get("href")
+                if href:
+                    yield href
+            # Drop every finished element so only the open path stays in memory
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
 def delete_file(file_path: str) -> Optional[bool]:
     """
     Delete a file if it exists.
@@ -262,10 +735,6 @@ def delete_file(file_path: str) -> Optional[bool]:
     Optional[bool]: True if the file was deleted successfully, False if the file doesn't exist,
                     None if an error occurred during deletion.
     """
-    # Set up logging
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
-    logger = logging.getLogger(__name__)
-
     try:
         if os.path.exists(file_path):
             os.remove(file_path)
@@ -285,16 +754,9 @@ def delete_file(file_path: str) -> Optional[bool]:
 
     return None
 
-def find_text(text, left_delimiter, right_delimiter=None, max_chars=None):
-    """
-    Search for text between delimiters and capture the text between the left and right delimiters.
-
-    :param text: The text to search in
-    :param left_delimiter: The left delimiter to search for
-    :param right_delimiter: The right delimiter to search for (optional)
-    :param max_chars: Maximum number of characters to capture between delimiters (optional)
-    :return: The captured text, or None if the delimiters are not found
-    """
+@functools.lru_cache(maxsize=256)
+def _compile_find_text(left_delimiter, right_delimiter, max_chars):
+    """Compile the find_text pattern for a delimiter pair and length limit."""
     # Escape special regex characters in the delimiters
     escaped_left_delimiter = re.escape(left_delimiter)
     escaped_right_delimiter = re.escape(right_delimiter) if right_delimiter else ""
@@ -311,18 +773,102 @@ def find_text(text, left_delimiter, right_delimiter=None, max_chars=None):
         else:
             pattern = f"{escaped_left_delimiter}(.*)"
 
-    # Search for the pattern
-    match = re.search(pattern, text, re.DOTALL)
+    return re.compile(pattern, re.DOTALL)
+
+def find_text(text, left_delimiter, right_delimiter=None, max_chars=None):
+    """
+    Search for text between delimiters and capture the text between the left and right delimiters.
+
+    :param text: The text to search in
+    :param left_delimiter: The left delimiter to search for
+    :param right_delimiter: The right delimiter to search for (optional)
+    :param max_chars: Maximum number of characters to capture between delimiters (optional)
+    :return: The captured text, or None if the delimiters are not found
+    """
+    if max_chars is None:
+        # Delimiters are matched literally, so a plain substring scan gives
+        # the same result as the regex without running the regex engine
+        start = text.find(left_delimiter)
+        if start < 0:
+            return None
+        start += len(left_delimiter)
+        if right_delimiter:
+            end = text.find(right_delimiter, start)
+            return text[start:end].strip() if end >= 0 else None
+        return text[start:].strip()
+
+    match = _compile_find_text(left_delimiter, right_delimiter, max_chars).search(text)
 
     if match:
         return match.group(1).strip()
     else:
         return None
 
+@functools.lru_cache(maxsize=64)
+def _compile_left_delimiters(left_delimiters):
+    """Compile a Hyperscan database reporting the first hit of each left delimiter."""
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(left.encode("utf-8")) for left in left_delimiters],
+        ids=list(range(len(left_delimiters))),
+        elements=len(left_delimiters),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(left_delimiters),
+    )
+    return database
+
+def extract_many(text, delimiter_pairs):
+    """
+    Run find_text for several delimiter pairs over the same text.
+
+    When the optional hyperscan package is installed, all left delimiters are
+    located in a single pass over the text and each right delimiter is then
+    found with a substring scan; otherwise find_text is called once per pair.
+    Either way the results match find_text(text, left, right).
+
+    :param text: The text to search in
+    :param delimiter_pairs: A list of (left_delimiter, right_delimiter) tuples;
+        right_delimiter may be None to capture to the end of the text
+    :return: A dict mapping each delimiter pair to its captured text, or None
+        if the delimiters are not found
+    """
+    pairs = [tuple(pair) for pair in delimiter_pairs]
+    lefts = tuple(sorted({left for left, _ in pairs if left}))
+    if hyperscan is None or not lefts:
+        return {pair: find_text(text, *pair) for pair in pairs}
+
+    data = text.encode("utf-8")
+    left_ends = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        left_ends[lefts[pattern_id]] = end
+
+    _compile_left_delimiters(lefts).scan(data, match_event_handler=on_match)
+
+    results = {}
+    for left, right in pairs:
+        if not left:
+            results[(left, right)] = find_text(text, left, right)
+            continue
+        start = left_ends.get(left)
+        if start is None:
+            results[(left, right)] = None
+        elif right:
+            end = data.find(right.encode("utf-8"), start)
+            results[(left, right)] = (
+                data[start:end].decode("utf-8").strip() if end >= 0 else None
+            )
+        else:
+            results[(left, right)] = data[start:].decode("utf-8").strip()
+    return results
+
 def read_excel_to_dataframe(file_path: str) -> pd.DataFrame:
     """
     Reads an Excel file and returns its contents as a pandas DataFrame.
 
+    The workbook is read with the Rust-based calamine engine and a parquet
+    copy is saved next to it as "<file_path>.parquet.cache". Later reads use
+    that copy for as long as it is newer than the workbook.
+
     Parameters:
     file_path (str): The path to the Excel file.
 
@@ -333,10 +879,19 @@ def read_excel_to_dataframe(file_path: str) -> pd.DataFrame:
     FileNotFoundError: If the specified file_path does not exist.
     Exception: If any other error occurs during the reading process.
     """
+    cache_path = f"{file_path}.parquet.cache"
     try:
+        if (
+            os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= os.path.getmtime(file_path)
+        ):
+            try:
+                return pd.read_parquet(cache_path)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable parquet cache '{cache_path}': {str(e)}")
+
         # Read the Excel file without specifying a sheet name
-        df = pd.read_excel(file_path)
-        return df
+        df = pd.read_excel(file_path, engine="calamine")
     except FileNotFoundError:
         print(f"Error: The file {file_path} was not found.")
         return None
@@ -344,6 +899,27 @@ def read_excel_to_dataframe(file_path: str) -> pd.DataFrame:
         print(f"An error occurred: {str(e)}")
         return None
 
+    # Write to a temporary file and swap it in, so readers never see a partial cache
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path) or ".", suffix=".tmp"
+        )
+        os.close(fd)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write parquet cache '{cache_path}': {str(e)}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+def _write_file(file_path, content):
+    """Write str or bytes content to file_path, replacing any existing file."""
+    mode = "wb" if isinstance(content, bytes) else "w"
+    with open(file_path, mode) as file:
+        file.write(content)
+
 def save_json_to_file(data, detailexp, validateresume, path_to_save):
     """
     Save JSON data, detail experience, and resume review to files.
@@ -355,7 +931,7 @@ def save_json_to_file(data, detailexp, validateresume, path_to_save):
         path_to_save (str): The path where the files will be saved.
 
     Returns:
-        str: The file path of the saved JSON file.
+        str: The file path of the saved detail experience file.
 
     Raises:
         OSError: If there is an error creating the directory or writing the files.
@@ -363,35 +939,33 @@ def save_json_to_file(data, detailexp, validateresume, path_to_save):
     # Ensure the directory exists
     os.makedirs(path_to_save, exist_ok=True)
 
-    # Convert data to JSON string
-    json_str = json.dumps(data, indent=4)
+    # Convert data to JSON bytes
+    json_bytes = orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    )
 
     # Extract relevant information for filename
     candidate_name = data["Candidate"]["Name"]
     position_applied = data["Candidate"]["Applied for"]
     match_score = data["Key Metrics"]["Match Score"]
+    suffix = f"{candidate_name}_{position_applied}_{match_score.replace(' ', '_')}"
+
+    # JSON Summary, Detail Experience and Validate Resume Review
+    json_path = os.path.join(path_to_save, f"{suffix}.json")
+    detail_path = os.path.join(path_to_save, f"Detail-{suffix}.txt")
+    validate_path = os.path.join(path_to_save, f"Validate-{suffix}.txt")
+
+    # Write the three files concurrently; the threads spend their time in I/O
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(_write_file, json_path, json_bytes),
+            executor.submit(_write_file, detail_path, detailexp),
+            executor.submit(_write_file, validate_path, validateresume),
+        ]
+        for future in futures:
+            future.result()
 
-    # JSON Summary
-    filename = (
-        f"{candidate_name}_{position_applied}_{match_score.replace(' ', '_')}.json"
-    )
-    file_path = os.path.join(path_to_save, filename)
-    with open(file_path, "w") as file:
-        file.write(json_str)
-
-    # Detail Experience
-    detailexpFile = f"Detail-{candidate_name}_{position_applied}_{match_score.replace(' ', '_')}.txt"
-    file_path = os.path.join(path_to_save, detailexpFile)
-    with open(file_path, "w") as file:
-        file.write(detailexp)
-
-    # Validate Resume Review
-    validateFile = f"Validate-{candidate_name}_{position_applied}_{match_score.replace(' ', '_')}.txt"
-    resume_file_path = os.path.join(path_to_save, validateFile)
-    with open(resume_file_path, "w") as file:
-        file.write(validateresume)
-
-    return file_path
+    return detail_path
 
 def fix_json(json_string, speed="fast"):
     prompt = f"You are a JSON formatter, fixing any issues with JSON formats. Review the following JSON: {json_string}. Return only the fixed JSON with no additional content. Do not add Here is the fixed JSON or any other text."
@@ -420,7 +994,7 @@ def convert_to_dict(json_output):
     cleaned_input_str = cleaned_input_str.strip("[]")
 
     # Load the cleaned JSON string into a dictionary
-    output_dict = json.loads(cleaned_input_str)
+    output_dict = orjson.loads(cleaned_input_str)
 
     return output_dict
 
@@ -433,16 +1007,13 @@ def clean_text(text):
     text = text.replace("\\", "")
     # If there are other specific patterns to clean, use re.sub()
     # Example: Remove annotations or other specific objects
-    text = re.sub(r"\\(.*?)\\", "", text)
+    text = _BACKSLASH_ESC_RE.sub("", text)
     return text
 
 
 def get_name_from_string(s):
-    # Define the regular expression pattern to match the Name line
-    pattern = r"Name:\s*(.+)"
-
-    # Use re.search to find a match in the string
-    match = re.search(pattern, s)
+    # Find the Name line
+    match = _NAME_RE.search(s)
 
     # If a match is found, return the matching group (the name)
     if match:
@@ -511,11 +1082,15 @@ def process_content(content):
     values_dict = generate_values_dict_from_content(content)
 
     for line in lines:
-        if line.strip() and line[0].isdigit() and ". " in line:
-            current_root = line.split(". ", 1)[1]
+        stripped = line.strip()
+        if not stripped:
+            continue
+        match = _NUM_PREFIX_RE.match(line)
+        if match:
+            current_root = match.group(2)
             processed_content[current_root] = {}
-        elif "-" in line and current_root is not None:
-            key = line.strip().lstrip("-").strip()
+        elif current_root is not None and "-" in stripped:
+            key = stripped.lstrip("-").strip()
             value = values_dict.get(key, "Not provided")
             processed_content[current_root][key] = value
 
@@ -560,10 +1135,74 @@ def update_content(info_dict):
             del info_dict[category][item]
     return info_dict
 
-async def write_to_redis(key, value, host="192.168.1.12", port=6379):
-    r = redis.Redis(host, port, decode_responses=True)
+async def _redis_pool_guard(loop, pool):
+    """Hold a pool open until the loop shuts down its async generators."""
+    try:
+        yield
+    finally:
+        _REDIS_POOLS.pop(loop, None)
+        await pool.disconnect()
+
+async def _redis_pool():
+    """Return the Redis connection pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    entry = _REDIS_POOLS.get(loop)
+    if entry is None:
+        pool = redis.ConnectionPool(
+            host=REDIS_HOST, port=REDIS_PORT, decode_responses=True, max_connections=32
+        )
+        guard = _redis_pool_guard(loop, pool)
+        # Starting the generator registers it for loop.shutdown_asyncgens()
+        await guard.__anext__()
+        entry = _REDIS_POOLS[loop] = (pool, guard)
+    return entry[0]
+
+async def close_redis_pool():
+    """
+    Disconnect the running loop's Redis pool.
+
+    asyncio.run() does this automatically; call it before closing an event
+    loop that is managed by hand.
+    """
+    entry = _REDIS_POOLS.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        pool, guard = entry
+        await guard.aclose()
+        await pool.disconnect()
+
+async def write_to_redis(key, value, host=None, port=None):
+    """
+    Set a key in Redis using the connection pool of the running event loop.
+
+    Args:
+        key (str): The key to set.
+        value (str): The value to store.
+        host (str, optional): Redis host. Defaults to REDIS_HOST; passing a
+            different host or port opens a one-off connection instead of the pool.
+        port (int, optional): Redis port. Defaults to REDIS_PORT.
+    """
+    if (host or REDIS_HOST) != REDIS_HOST or (port or REDIS_PORT) != REDIS_PORT:
+        r = redis.Redis(host or REDIS_HOST, port or REDIS_PORT, decode_responses=True)
+        await r.set(key, value)
+        await r.close()
+        return
+
+    r = redis.Redis(connection_pool=await _redis_pool())
     await r.set(key, value)
-    await r.close()
+
+async def write_many_to_redis(pairs):
+    """
+    Set many keys in Redis in a single round trip.
+
+    Args:
+        pairs (dict or Iterable[tuple]): Keys and values to set.
+    """
+    items = pairs.items() if isinstance(pairs, dict) else pairs
+    r = redis.Redis(connection_pool=await _redis_pool())
+    async with r.pipeline(transaction=False) as pipe:
+        for key, value in items:
+            pipe.set(key, value)
+        await pipe.execute()
 
 def remove_preface(text: str) -> str:
     """
@@ -575,7 +1214,7 @@ def remove_preface(text: str) -> str:
     Returns:
     str: The text with any preface removed, starting from the first valid JSON character.
     """
-    match: Optional[re.Match] = re.search(r"[\{\[]", text)
+    match: Optional[re.Match] = _JSON_START_RE.search(text)
     
     if match:
         start: int = match.start()
@@ -597,7 +1236,7 @@ def locate_json_error(json_str: str, error_msg: str) -> Tuple[int, int, str]:
     Returns:
     Tuple[int, int, str]: Line number, column number, and the problematic part of the JSON string.
     """
-    match = re.search(r"line (\d+) column (\d+)", error_msg)
+    match = _JSON_ERROR_POS_RE.search(error_msg)
     if not match:
         return 0, 0, "Could not parse error message"
 